@@ -13,9 +13,13 @@ Usage:
 
 import argparse
 import asyncio
+import functools
+import os
 import struct
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Set, Union
 from bleak import BleakScanner, BleakClient
 
 # For keyboard automation - using pynput for simplicity and keyboard layout compatibility
@@ -27,12 +31,26 @@ except ImportError:
     print("⚠️  Warning: pynput not available, auto-type won't work")
     print("   Install with: pip install pynput")
 
+# Optional faster event loop - falls back to the stock asyncio loop if missing
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 # UUIDs from decompiled Android app
 DISTO_SERVICE_UUID = "3ab10100-f831-4395-b29d-570977d5bf94"
 DISTANCE_CHAR_UUID = "3ab10101-f831-4395-b29d-570977d5bf94"
 DISTANCE_UNIT_CHAR_UUID = "3ab10102-f831-4395-b29d-570977d5bf94"
 COMMAND_CHAR_UUID = "3ab10109-f831-4395-b29d-570977d5bf94"
+DISTO_SERVICE_UUID_LOWER = DISTO_SERVICE_UUID.lower()
+
+# Distance payload: 4-byte IEEE 754 float, Little Endian
+_DIST_STRUCT = struct.Struct('<f')
+
+# Single worker so overlapping auto-type tasks never send keystrokes concurrently
+_TYPING_EXECUTOR = ThreadPoolExecutor(max_workers=1)
 
 # Unit code mappings
 DISTANCE_UNITS = {
@@ -48,29 +66,37 @@ DISTANCE_UNITS = {
     9: "ft+in",
 }
 
-# Global state
-current_distance = None
-current_unit = 0
-ble_client = None  # BLE client for sending commands from notification handler
-timer_mode = False  # If True, first measurement triggers a delayed second measurement
-waiting_for_final_measurement = False  # Flag to know if we're waiting for the final measurement
-measurement_counter = 0  # Counter to track measurement cycles
-expected_cycle_id = None  # ID of the cycle we're expecting a final measurement from
-measurement_in_progress = False  # Flag to prevent overlapping measurements
-measurement_delay = 1.0  # Delay in seconds before taking the final measurement
-auto_type = False  # If True, automatically type measurements to active window
-keyboard_controller = Controller() if PYNPUT_AVAILABLE else None  # Keyboard controller for auto-type
-decimal_separator = ','  # Decimal separator for formatted output ('.' or ',')
-
-
-def parse_distance(data: bytes) -> float:
+
+@dataclass
+class DistoState:
+    """Reader state shared between the notification handlers and the measurement tasks."""
+
+    current_distance: Optional[float] = None
+    current_unit: int = 0
+    ble_client: Optional[BleakClient] = None  # BLE client for sending commands from notification handler
+    timer_mode: bool = False  # If True, first measurement triggers a delayed second measurement
+    waiting_for_final_measurement: bool = False  # Flag to know if we're waiting for the final measurement
+    measurement_counter: int = 0  # Counter to track measurement cycles
+    expected_cycle_id: Optional[int] = None  # ID of the cycle we're expecting a final measurement from
+    measurement_in_progress: bool = False  # Flag to prevent overlapping measurements
+    final_event: Optional[asyncio.Event] = None  # Set when the final measurement of the current cycle arrives
+    measurement_delay: float = 1.0  # Delay in seconds before taking the final measurement
+    auto_type: bool = False  # If True, automatically type measurements to active window
+    keyboard_controller: Any = field(  # Keyboard controller for auto-type
+        default_factory=lambda: Controller() if PYNPUT_AVAILABLE else None
+    )
+    decimal_separator: str = ','  # Decimal separator for formatted output ('.' or ',')
+    pending_tasks: Set[asyncio.Task] = field(default_factory=set)  # Strong refs to fire-and-forget tasks
+
+
+def parse_distance(data: Union[bytes, bytearray]) -> float:
     """
     Parse distance value from BLE characteristic.
 
     Format: 4-byte IEEE 754 float, Little Endian
 
     Args:
-        data: Raw bytes from DISTANCE characteristic
+        data: Raw bytes from DISTANCE characteristic (bytes or bytearray)
 
     Returns:
         Distance value as float
@@ -79,19 +105,18 @@ def parse_distance(data: bytes) -> float:
         print(f"Warning: Expected 4 bytes, got {len(data)}")
         return 0.0
 
-    # Unpack as Little Endian float
-    distance = struct.unpack('<f', data)[0]
-    return distance
+    # Unpack as Little Endian float directly from the notification buffer
+    return _DIST_STRUCT.unpack_from(data)[0]
 
 
-def parse_unit(data: bytes) -> int:
+def parse_unit(data: Union[bytes, bytearray]) -> int:
     """
     Parse unit code from BLE characteristic.
 
     Format: 1-byte integer
 
     Args:
-        data: Raw bytes from DISTANCE_UNIT characteristic
+        data: Raw bytes from DISTANCE_UNIT characteristic (bytes or bytearray)
 
     Returns:
         Unit code as integer
@@ -103,38 +128,83 @@ def parse_unit(data: bytes) -> int:
     return data[0]
 
 
-def type_measurement(distance: float):
+def _spawn(state: DistoState, coro) -> asyncio.Task:
+    """
+    Schedule a fire-and-forget task and keep a reference to it until it finishes.
+
+    Args:
+        state: Shared reader state holding the pending tasks
+        coro: Coroutine to run
+
+    Returns:
+        The created task
+    """
+    task = asyncio.create_task(coro)
+    state.pending_tasks.add(task)
+    task.add_done_callback(state.pending_tasks.discard)
+    return task
+
+
+def _format_distance(distance: float, separator: str) -> str:
+    """
+    Format a distance with 3 decimals and the given decimal separator.
+
+    Args:
+        distance: Distance value to format
+        separator: Decimal separator ('.' or ',')
+
+    Returns:
+        Formatted distance string (without unit)
+    """
+    value_str = f"{distance:.3f}"
+    if separator == '.':
+        return value_str
+    return value_str.replace('.', separator)
+
+
+def _do_type(controller, value_str: str):
+    """
+    Type a value with pynput and press Enter.
+
+    Blocking: run in _TYPING_EXECUTOR so keystroke synthesis doesn't stall the
+    event loop and values are typed one at a time.
+
+    Args:
+        controller: pynput keyboard Controller
+        value_str: Formatted value to type
+    """
+    controller.type(value_str)
+    controller.press(Key.enter)
+    controller.release(Key.enter)
+
+
+async def type_measurement(state: DistoState, value_str: str):
     """
     Type the measurement value into the active window and press Enter.
     Uses pynput for simple, keyboard layout-independent typing.
 
     Args:
-        distance: Distance value to type (without unit)
+        state: Shared reader state
+        value_str: Formatted distance value to type (without unit)
     """
-    if not auto_type or not keyboard_controller:
+    if not state.auto_type or not state.keyboard_controller:
         return
 
-    # Format with configured decimal separator
-    value_str = f"{distance:.3f}"
-    value_str = value_str.replace('.', decimal_separator)
-
     try:
         # Small delay to ensure the window is ready
-        time.sleep(0.2)
-
-        # Type the measurement value
-        keyboard_controller.type(value_str)
+        await asyncio.sleep(0.2)
 
-        # Press Enter
-        keyboard_controller.press(Key.enter)
-        keyboard_controller.release(Key.enter)
+        # Type the measurement value and press Enter off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            _TYPING_EXECUTOR, _do_type, state.keyboard_controller, value_str
+        )
 
         print(f"✅ Typing complete")
     except Exception as e:
         print(f"❌ Typing error: {e}")
 
 
-def distance_notification_handler(sender, data: bytearray):
+def distance_notification_handler(state: DistoState, sender, data: bytearray):
     """
     Handle distance value notifications from the device.
 
@@ -144,58 +214,66 @@ def distance_notification_handler(sender, data: bytearray):
     In timer mode:
     - First measurement (from button press) is ignored and triggers a delayed measurement
     - Second measurement (after 1s delay) is displayed
-    """
-    global current_distance, waiting_for_final_measurement, ble_client, measurement_counter
-    global expected_cycle_id, measurement_in_progress
 
-    distance = parse_distance(bytes(data))
-    current_distance = distance
-    unit_str = DISTANCE_UNITS.get(current_unit, f"unknown({current_unit})")
+    Args:
+        state: Shared reader state (bound with functools.partial)
+        sender: Characteristic that sent the notification
+        data: Raw notification payload
+    """
+    distance = parse_distance(data)
+    state.current_distance = distance
+    unit_str = DISTANCE_UNITS.get(state.current_unit, f"unknown({state.current_unit})")
 
     # Format distance with configured decimal separator
-    distance_str = f"{distance:.3f}"
-    distance_str = distance_str.replace('.', decimal_separator)
+    distance_str = _format_distance(distance, state.decimal_separator)
 
-    if timer_mode:
-        if waiting_for_final_measurement and expected_cycle_id is not None:
+    if state.timer_mode:
+        if state.waiting_for_final_measurement and state.expected_cycle_id is not None:
             # This is the final measurement after the delay - display it
             print(f"✓ Final measurement: {distance_str} {unit_str}\n")
 
             # Type the measurement if auto-type is enabled
-            type_measurement(distance)
-
-            waiting_for_final_measurement = False
-            measurement_in_progress = False
-            expected_cycle_id = None
-        elif not measurement_in_progress:
+            _spawn(state, type_measurement(state, distance_str))
+
+            state.waiting_for_final_measurement = False
+            state.measurement_in_progress = False
+            state.expected_cycle_id = None
+            if state.final_event is not None:
+                state.final_event.set()
+        elif not state.measurement_in_progress:
             # This is the initial measurement from button press - start new cycle
             # Only accept if no measurement is currently in progress
-            measurement_counter += 1
-            measurement_in_progress = True
-            expected_cycle_id = measurement_counter
+            state.measurement_counter += 1
+            state.measurement_in_progress = True
+            state.expected_cycle_id = state.measurement_counter
+            state.final_event = asyncio.Event()
 
-            delay_text = f"{measurement_delay:.1f} second" if measurement_delay == 1.0 else f"{measurement_delay:.1f} seconds"
+            delay = state.measurement_delay
+            delay_text = f"{delay:.1f} second" if delay == 1.0 else f"{delay:.1f} seconds"
             print(f"⏱️  Button detected (measurement: {distance_str} {unit_str}) - measuring in {delay_text}...")
-            waiting_for_final_measurement = True
+            state.waiting_for_final_measurement = True
 
             # Schedule the delayed measurement
-            asyncio.create_task(delayed_measurement(measurement_counter))
+            _spawn(state, delayed_measurement(state, state.measurement_counter, state.final_event))
         # else: Ignore this notification - a measurement is already in progress
     else:
         # Normal mode - just display the measurement
         print(f"📏 Distance: {distance_str} {unit_str}\n")
 
 
-def unit_notification_handler(sender, data: bytearray):
+def unit_notification_handler(state: DistoState, sender, data: bytearray):
     """
     Handle distance unit notifications from the device.
 
     Called when the DISTANCE_UNIT characteristic sends a notification.
-    """
-    global current_unit
 
-    unit = parse_unit(bytes(data))
-    current_unit = unit
+    Args:
+        state: Shared reader state (bound with functools.partial)
+        sender: Characteristic that sent the notification
+        data: Raw notification payload
+    """
+    unit = parse_unit(data)
+    state.current_unit = unit
 
 
 async def send_command(client: BleakClient, command: str):
@@ -221,48 +299,115 @@ async def send_command(client: BleakClient, command: str):
         print(f"⚠️  Error sending command: {e}")
 
 
-async def delayed_measurement(cycle_id):
+async def delayed_measurement(state: DistoState, cycle_id, final_event: asyncio.Event):
     """
     Turn on laser, wait configured delay, then trigger a measurement.
 
     Called automatically when timer mode is enabled and a button press is detected.
 
     Args:
+        state: Shared reader state
         cycle_id: Measurement cycle identifier
+        final_event: Event set when this cycle's final measurement arrives
     """
-    global ble_client, waiting_for_final_measurement, expected_cycle_id, measurement_in_progress
-
-    if ble_client:
+    if state.ble_client:
         # Turn on laser immediately so user can aim
-        await send_command(ble_client, "o")
+        await send_command(state.ble_client, "o")
         print(f"🔴 Laser activated - aim at target...")
     else:
         print(f"❌ Error: connection lost")
-        measurement_in_progress = False
-        expected_cycle_id = None
+        state.measurement_in_progress = False
+        state.expected_cycle_id = None
         return
 
-    await asyncio.sleep(measurement_delay)
+    await asyncio.sleep(state.measurement_delay)
 
     # Check if this cycle is still the expected one (might have been cancelled)
-    if expected_cycle_id != cycle_id:
+    if state.expected_cycle_id != cycle_id:
         return
 
-    if ble_client:
+    if state.ble_client:
         print(f"📡 Measuring...")
-        await send_command(ble_client, "g")
+        await send_command(state.ble_client, "g")
 
         # Timeout safety: reset state if no measurement arrives within 3 seconds
-        await asyncio.sleep(3.0)
-        if waiting_for_final_measurement and expected_cycle_id == cycle_id:
-            print(f"⚠️  Timeout - no measurement received, resetting...")
-            waiting_for_final_measurement = False
-            measurement_in_progress = False
-            expected_cycle_id = None
+        try:
+            await asyncio.wait_for(final_event.wait(), timeout=3.0)
+        except asyncio.TimeoutError:
+            if state.waiting_for_final_measurement and state.expected_cycle_id == cycle_id:
+                print(f"⚠️  Timeout - no measurement received, resetting...")
+                state.waiting_for_final_measurement = False
+                state.measurement_in_progress = False
+                state.expected_cycle_id = None
     else:
         print(f"❌ Error: connection lost")
-        measurement_in_progress = False
-        expected_cycle_id = None
+        state.measurement_in_progress = False
+        state.expected_cycle_id = None
+
+
+class StdinReader:
+    """
+    Read lines from stdin without blocking the event loop.
+
+    Reads the raw stdin file descriptor when the event loop reports it readable,
+    instead of tying up an executor thread with input(). Lines are split here
+    so several commands arriving in one read (paste, open pipe) are all returned.
+    Descriptors the event loop can't watch (regular files, /dev/null) never
+    block, so they are read directly.
+    """
+
+    def __init__(self):
+        self._fd = sys.stdin.fileno()
+        self._pollable = True
+        self._buffer = bytearray()
+        self._eof = False
+
+    async def _wait_readable(self):
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def on_readable():
+            if not ready.done():
+                ready.set_result(None)
+
+        try:
+            loop.add_reader(self._fd, on_readable)
+        except OSError:
+            # epoll/libuv refuse regular files and some character devices;
+            # reads on those never block, so fall back to reading directly
+            self._pollable = False
+            return
+
+        try:
+            await ready
+        finally:
+            loop.remove_reader(self._fd)
+
+    async def readline(self, prompt: str = "") -> str:
+        """
+        Read one line from stdin.
+
+        Args:
+            prompt: Text displayed before reading
+
+        Returns:
+            Line read from stdin (with trailing newline), or an empty string on EOF
+        """
+        print(prompt, end='', flush=True)
+
+        while b'\n' not in self._buffer and not self._eof:
+            if self._pollable:
+                await self._wait_readable()
+            chunk = os.read(self._fd, 4096)
+            if chunk:
+                self._buffer += chunk
+            else:
+                self._eof = True
+
+        end = self._buffer.find(b'\n') + 1 or len(self._buffer)
+        line = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return line.decode(errors='replace')
 
 
 async def find_disto_device():
@@ -270,26 +415,37 @@ async def find_disto_device():
     Scan for BLE devices and find the DISTO device.
 
     Filters for devices with "disto", "stabila", or "wdm" in their name
-    (case-insensitive).
+    (case-insensitive). The scan stops as soon as a matching device
+    advertises, or after 10 seconds.
 
     Returns:
         BLEDevice object if found, None otherwise
     """
     print("🔍 Scanning for DISTO device...")
 
-    devices = await BleakScanner.discover(timeout=10.0)
+    found_device = None
+    found_event = asyncio.Event()
 
-    for device in devices:
-        if device.name:
-            name_lower = device.name.lower()
-            if "disto" in name_lower or "stabila" in name_lower or "wdm" in name_lower:
-                print(f"✓ Found device: {device.name} ({device.address})")
-                return device
+    def detection_callback(device, advertisement_data):
+        nonlocal found_device
+        if found_device is not None or not device.name:
+            return
+        name_lower = device.name.lower()
+        if "disto" in name_lower or "stabila" in name_lower or "wdm" in name_lower:
+            found_device = device
+            found_event.set()
+
+    async with BleakScanner(detection_callback=detection_callback):
+        try:
+            await asyncio.wait_for(found_event.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            return None
 
-    return None
+    print(f"✓ Found device: {found_device.name} ({found_device.address})")
+    return found_device
 
 
-async def connect_and_listen(device, active_mode=False):
+async def connect_and_listen(state: DistoState, device, active_mode=False):
     """
     Connect to the DISTO device and listen for measurements.
 
@@ -302,28 +458,32 @@ async def connect_and_listen(device, active_mode=False):
     6. Listen for notifications
 
     Args:
+        state: Shared reader state
         device: BLEDevice object to connect to
         active_mode: If True, allows triggering measurements from PC
     """
-    global ble_client, timer_mode, measurement_in_progress, expected_cycle_id
+    # Start tasks eagerly (Python 3.12+) so delayed_measurement sends the
+    # laser command without waiting for an extra event loop iteration
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
 
     async with BleakClient(device.address) as client:
-        ble_client = client  # Store client for use in notification handler
+        state.ble_client = client  # Store client for use in notification handler
 
         # Enable timer mode only in passive mode
-        timer_mode = not active_mode
-        measurement_in_progress = False
-        expected_cycle_id = None
+        state.timer_mode = not active_mode
+        state.measurement_in_progress = False
+        state.expected_cycle_id = None
 
         print(f"✓ Connected to {device.name}")
 
         # Check if DISTO service is available
-        services = client.services
-        if DISTO_SERVICE_UUID.lower() not in [s.uuid.lower() for s in services]:
+        service_uuids = {service.uuid.lower() for service in client.services}
+        if DISTO_SERVICE_UUID_LOWER not in service_uuids:
             print(f"❌ Error: DISTO service {DISTO_SERVICE_UUID} not found!")
             print("Available services:")
-            for service in services:
-                print(f"  - {service.uuid}")
+            for service_uuid in sorted(service_uuids):
+                print(f"  - {service_uuid}")
             return
 
         print(f"✓ Found DISTO service")
@@ -335,7 +495,9 @@ async def connect_and_listen(device, active_mode=False):
 
         # Enable indications on DISTANCE characteristic
         print(f"✓ Enabling notifications on DISTANCE characteristic...")
-        await client.start_notify(DISTANCE_CHAR_UUID, distance_notification_handler)
+        await client.start_notify(
+            DISTANCE_CHAR_UUID, functools.partial(distance_notification_handler, state)
+        )
 
         # CRITICAL: Wait 100ms between characteristic notifications
         print("⏳ Waiting 100ms...")
@@ -343,7 +505,9 @@ async def connect_and_listen(device, active_mode=False):
 
         # Enable indications on DISTANCE_UNIT characteristic
         print(f"✓ Enabling notifications on DISTANCE_UNIT characteristic...")
-        await client.start_notify(DISTANCE_UNIT_CHAR_UUID, unit_notification_handler)
+        await client.start_notify(
+            DISTANCE_UNIT_CHAR_UUID, functools.partial(unit_notification_handler, state)
+        )
 
         print("\n" + "="*60)
         if active_mode:
@@ -363,10 +527,13 @@ async def connect_and_listen(device, active_mode=False):
         try:
             if active_mode:
                 # Interactive mode
-                loop = asyncio.get_event_loop()
+                stdin_reader = StdinReader()
                 while True:
                     # Read user input in a non-blocking way
-                    user_input = await loop.run_in_executor(None, input, "Command: ")
+                    user_input = await stdin_reader.readline("Command: ")
+                    if not user_input:
+                        # EOF on stdin
+                        break
                     user_input = user_input.strip().lower()
 
                     if user_input == 'q':
@@ -392,19 +559,21 @@ async def connect_and_listen(device, active_mode=False):
         except KeyboardInterrupt:
             print("\n\n👋 Disconnecting...")
 
-        # Clean up global state
-        ble_client = None
-        timer_mode = False
-        measurement_in_progress = False
-        expected_cycle_id = None
+        # Clean up shared state
+        state.ble_client = None
+        state.timer_mode = False
+        state.measurement_in_progress = False
+        state.expected_cycle_id = None
+        state.final_event = None
 
 
 async def main(active_mode=False, delay=1.0, enable_auto_type=False, separator='.'):
     """Main entry point."""
-    global measurement_delay, auto_type, decimal_separator
-    measurement_delay = delay
-    auto_type = enable_auto_type
-    decimal_separator = separator
+    state = DistoState(
+        measurement_delay=delay,
+        auto_type=enable_auto_type,
+        decimal_separator=separator,
+    )
 
     print("="*60)
     print("Leica DISTO D1/D110 BLE Reader")
@@ -412,7 +581,7 @@ async def main(active_mode=False, delay=1.0, enable_auto_type=False, separator='
         print("Mode: Active (trigger from PC)")
     else:
         print(f"Mode: Passive (listen to button, delay: {delay}s)")
-    if auto_type:
+    if state.auto_type:
         print("Auto-type: ENABLED - measurements will be typed automatically")
     print("="*60 + "\n")
 
@@ -426,7 +595,7 @@ async def main(active_mode=False, delay=1.0, enable_auto_type=False, separator='
 
     # Connect and listen
     try:
-        await connect_and_listen(device, active_mode=active_mode)
+        await connect_and_listen(state, device, active_mode=active_mode)
     except Exception as e:
         print(f"\n❌ Error: {e}")
         return 1
@@ -474,13 +643,21 @@ Examples:
     )
     args = parser.parse_args()
 
+    # Use uvloop when installed for lower notification-handling latency
+    run_kwargs = {}
+    if UVLOOP_AVAILABLE:
+        if sys.version_info >= (3, 12):
+            run_kwargs['loop_factory'] = uvloop.new_event_loop
+        else:
+            uvloop.install()
+
     try:
         exit_code = asyncio.run(main(
             active_mode=args.active,
             delay=args.delay,
             enable_auto_type=args.auto_type,
             separator=args.separator
-        ))
+        ), **run_kwargs)
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")